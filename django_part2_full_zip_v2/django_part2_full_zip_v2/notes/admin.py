@@ -11,3 +11,17 @@ class NoteAdmin(admin.ModelAdmin):
 
     list_display = ("id", "title")
     search_fields = ("title",)
+
+    def get_queryset(self, request):
+        """Skip loading note content on the changelist, which never shows it.
+
+        The change, delete and history views also fetch through here and
+        do use ``content``, so they keep the full row.
+        """
+        queryset = super().get_queryset(request)
+        opts = self.model._meta
+        changelist = f"{opts.app_label}_{opts.model_name}_changelist"
+        match = request.resolver_match
+        if match is not None and match.url_name == changelist:
+            queryset = queryset.defer("content")
+        return queryset
@@ -1,13 +1,44 @@
 """Forms for creating and updating notes."""
 
+from functools import cache
+
 from django import forms
 
 from .models import Note
 
 
-class NoteForm(forms.ModelForm):
-    """ModelForm used for note create/update views."""
+class NoteForm(forms.Form):
+    """Form used for note create/update views.
+
+    The fields are declared explicitly instead of being generated from
+    the model, and ``instance``/``save()`` mirror the ModelForm API the
+    views rely on.
+    """
+
+    title = forms.CharField(max_length=255)
+    content = forms.CharField(widget=forms.Textarea)
+
+    def __init__(self, *args, instance=None, **kwargs):
+        if instance is not None:
+            kwargs.setdefault(
+                "initial", {"title": instance.title, "content": instance.content}
+            )
+        self.instance = instance if instance is not None else Note()
+        super().__init__(*args, **kwargs)
+
+    def save(self):
+        """Copy the cleaned data onto the instance, save and return it."""
+        self.instance.title = self.cleaned_data["title"]
+        self.instance.content = self.cleaned_data["content"]
+        self.instance.save()
+        return self.instance
+
+
+@cache
+def empty_note_form_html():
+    """Return the rendered markup of an unbound NoteForm.
 
-    class Meta:
-        model = Note
-        fields = ["title", "content"]
+    An unbound form always renders the same HTML, so it is built once
+    per process and reused for every create page.
+    """
+    return NoteForm().as_p()
@@ -0,0 +1,17 @@
+# Generated by Django 6.0 on 2026-10-15 09:54
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notes', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='note',
+            options={'ordering': ['id']},
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-15 09:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notes', '0002_alter_note_options'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='note',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
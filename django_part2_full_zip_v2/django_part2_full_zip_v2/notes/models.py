@@ -11,6 +11,10 @@ class Note(models.Model):
 
     title = models.CharField(max_length=255)
     content = models.TextField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["id"]
 
     def __str__(self) -> str:
         """Return a human-readable label for the note."""
@@ -0,0 +1,41 @@
+"""Signal handlers for the notes app.
+
+The note list is fragment-cached under a version number kept in the
+cache. Every write bumps the version once its transaction commits, so
+the next list render misses the cache even when the write did not move
+MAX(updated_at) (for example overlapping edits or clock skew between
+workers). The version lives in the default cache, which the project
+settings point at a file-based backend so every worker sees it.
+"""
+
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import Note
+
+LIST_VERSION_KEY = "notes:list_version"
+
+
+def get_list_version():
+    """Return the current version of the cached note list."""
+    # Seed from the clock so an evicted version never repeats an old one.
+    return cache.get_or_set(LIST_VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def bump_list_version():
+    """Invalidate every cached note list fragment."""
+    try:
+        cache.incr(LIST_VERSION_KEY)
+    except ValueError:
+        # The key was never set or has been evicted; reseed it.
+        cache.set(LIST_VERSION_KEY, time.time_ns(), timeout=None)
+
+
+@receiver(post_save, sender=Note)
+def note_saved(sender, **kwargs):
+    """Bump the list version after a note is created or edited."""
+    transaction.on_commit(bump_list_version)
@@ -8,18 +8,25 @@ These tests exercise the main use cases of the app:
   updating, and deleting notes.
 """
 
-from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from .forms import NoteForm
 from .models import Note
+from .signals import LIST_VERSION_KEY, bump_list_version, get_list_version
+from .views import NOTES_PER_PAGE
 
 
 class NoteModelTest(TestCase):
     """Tests for the Note model."""
 
-    def setUp(self):
-        self.note = Note.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.note = Note.objects.create(
             title="Test Note",
             content="This is the content of the test note.",
         )
@@ -39,6 +46,11 @@ class NoteModelTest(TestCase):
         max_length = self.note._meta.get_field("title").max_length
         self.assertEqual(max_length, 255)
 
+    def test_notes_are_ordered_by_id(self):
+        """Notes should come back in id order by default."""
+        self.assertEqual(Note._meta.ordering, ["id"])
+        self.assertIn("ORDER BY", str(Note.objects.all().query))
+
 
 class NoteFormTest(TestCase):
     """Tests for the NoteForm."""
@@ -63,16 +75,36 @@ class NoteFormTest(TestCase):
         self.assertFalse(form.is_valid())
         self.assertIn("content", form.errors)
 
+    def test_form_save_updates_instance(self):
+        """Saving a form bound to an instance should update that note."""
+        note = Note.objects.create(title="Old title", content="Old body.")
+        form_data = {"title": "New title", "content": "New body."}
+        form = NoteForm(data=form_data, instance=note)
+        self.assertTrue(form.is_valid())
+        self.assertEqual(form.save().pk, note.pk)
+        note.refresh_from_db()
+        self.assertEqual(note.title, "New title")
+        self.assertEqual(note.content, "New body.")
+
 
+# Keep view tests off the shared file cache so parallel runs stay isolated.
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
 class NoteViewTests(TestCase):
     """Tests for the note views (list, detail, create, update, delete)."""
 
-    def setUp(self):
-        self.note = Note.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.note = Note.objects.create(
             title="Initial Note",
             content="Initial note content.",
         )
 
+    def setUp(self):
+        # Cached list fragments outlive the per-test database rollback.
+        cache.clear()
+
     def test_note_list_view_status_code_and_template(self):
         """The list view should return HTTP 200 and use the correct template."""
         url = reverse("note_list")
@@ -81,6 +113,75 @@ class NoteViewTests(TestCase):
         self.assertTemplateUsed(response, "notes/note_list.html")
         self.assertContains(response, "Initial Note")
 
+    def test_note_list_view_is_paginated(self):
+        """The list view should only show one page of notes at a time."""
+        Note.objects.bulk_create(
+            [
+                Note(title=f"Bulk Note {i}", content="Bulk content.")
+                for i in range(NOTES_PER_PAGE)
+            ]
+        )
+        url = reverse("note_list")
+        response = self.client.get(url)
+        self.assertEqual(len(response.context["notes"]), NOTES_PER_PAGE)
+        self.assertEqual(response.context["page_obj"].paginator.num_pages, 2)
+
+        response = self.client.get(url, {"page": 2})
+        self.assertEqual(len(response.context["notes"]), 1)
+        self.assertContains(response, f"Bulk Note {NOTES_PER_PAGE - 1}")
+
+    def test_note_list_view_is_gzipped_when_accepted(self):
+        """The list view should be compressed for clients that accept gzip."""
+        url = reverse("note_list")
+        response = self.client.get(url, headers={"accept-encoding": "gzip"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+
+    def test_note_list_view_cache_hit_query_count(self):
+        """A cached list page should only count notes and read the version."""
+        url = reverse("note_list")
+        self.client.get(url)
+        with self.assertNumQueries(2):
+            self.client.get(url)
+
+    def test_note_list_view_reflects_updated_title(self):
+        """Editing a note should not leave a stale title in the cached list."""
+        url = reverse("note_list")
+        self.assertContains(self.client.get(url), "Initial Note")
+        self.note.title = "Renamed Note"
+        self.note.save()
+        response = self.client.get(url)
+        self.assertContains(response, "Renamed Note")
+        self.assertNotContains(response, "Initial Note")
+
+    def test_note_list_view_reflects_edit_with_unchanged_timestamp(self):
+        """An edit that leaves MAX(updated_at) alone should still show up."""
+        url = reverse("note_list")
+        self.assertContains(self.client.get(url), "Initial Note")
+        update_url = reverse("note_update", args=[self.note.pk])
+        data = {"title": "Renamed Note", "content": "Initial note content."}
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(update_url, data)
+        # Simulate a write whose timestamp lost the race to an older one.
+        Note.objects.filter(pk=self.note.pk).update(updated_at=self.note.updated_at)
+        response = self.client.get(url)
+        self.assertContains(response, "Renamed Note")
+        self.assertNotContains(response, "Initial Note")
+
+    def test_note_save_bumps_list_version(self):
+        """Saving a note should bump the list version once it commits."""
+        version = get_list_version()
+        with self.captureOnCommitCallbacks(execute=True):
+            Note.objects.create(title="Another Note", content="More.")
+        self.assertNotEqual(get_list_version(), version)
+
+    def test_bump_list_version_reseeds_missing_key(self):
+        """Bumping an evicted list version should reseed it, not fail."""
+        version = get_list_version()
+        cache.delete(LIST_VERSION_KEY)
+        bump_list_version()
+        self.assertNotEqual(get_list_version(), version)
+
     def test_note_detail_view_displays_note(self):
         """The detail view should show the selected note."""
         url = reverse("note_detail", args=[self.note.pk])
@@ -90,6 +191,19 @@ class NoteViewTests(TestCase):
         self.assertContains(response, "Initial Note")
         self.assertContains(response, "Initial note content.")
 
+    def test_note_detail_view_not_modified_for_matching_etag(self):
+        """A repeat GET with the current ETag should return 304."""
+        url = reverse("note_detail", args=[self.note.pk])
+        etag = self.client.get(url)["ETag"]
+        response = self.client.get(url, headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 304)
+
+        self.note.content = "Changed content."
+        self.note.save()
+        response = self.client.get(url, headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Changed content.")
+
     def test_note_detail_view_404_for_unknown_note(self):
         """Requesting a non-existent note should return 404."""
         url = reverse("note_detail", args=[9999])
@@ -102,26 +216,28 @@ class NoteViewTests(TestCase):
         response = self.client.get(url)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, "notes/note_form.html")
-        self.assertIsInstance(response.context["form"], NoteForm)
+        self.assertContains(response, "Create Note")
+        self.assertContains(response, NoteForm().as_p(), html=True)
 
     def test_note_create_view_valid_post_creates_note(self):
         """A valid POST to the create view should create a new note."""
         url = reverse("note_create")
         data = {"title": "New Note", "content": "New note content."}
         response = self.client.post(url, data)
-        # We started with one note in setUp; after creation we expect two.
-        self.assertEqual(Note.objects.count(), 2)
-        new_note = Note.objects.latest("id")
-        self.assertEqual(new_note.title, "New Note")
-        self.assertEqual(new_note.content, "New note content.")
-        self.assertRedirects(response, reverse("note_detail", args=[new_note.pk]))
+        # We started with one note in setUpTestData; after creation we expect two.
+        notes = list(Note.objects.values_list("pk", "title", "content"))
+        self.assertEqual(len(notes), 2)
+        new_pk, new_title, new_content = notes[-1]
+        self.assertEqual(new_title, "New Note")
+        self.assertEqual(new_content, "New note content.")
+        self.assertRedirects(response, reverse("note_detail", args=[new_pk]))
 
     def test_note_create_view_invalid_post_shows_errors(self):
         """An invalid POST should re-display the form with errors."""
         url = reverse("note_create")
         data = {"title": "", "content": ""}
         response = self.client.post(url, data)
-        # No new note created (still only the one from setUp)
+        # No new note created (still only the one from setUpTestData)
         self.assertEqual(Note.objects.count(), 1)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, "notes/note_form.html")
@@ -153,6 +269,20 @@ class NoteViewTests(TestCase):
         self.assertEqual(self.note.title, "Updated Title")
         self.assertEqual(self.note.content, "Updated content.")
 
+    def test_note_update_view_post_404_for_unknown_note(self):
+        """POSTing an update for a non-existent note should return 404."""
+        url = reverse("note_update", args=[9999])
+        data = {"title": "Updated Title", "content": "Updated content."}
+        response = self.client.post(url, data)
+        self.assertEqual(response.status_code, 404)
+
+    def test_note_update_view_invalid_post_404_for_unknown_note(self):
+        """An invalid update POST for a non-existent note should return 404."""
+        url = reverse("note_update", args=[9999])
+        data = {"title": "", "content": ""}
+        response = self.client.post(url, data)
+        self.assertEqual(response.status_code, 404)
+
     def test_note_delete_view_get_confirmation_page(self):
         """GET on the delete view should show a confirmation page."""
         url = reverse("note_delete", args=[self.note.pk])
@@ -167,3 +297,48 @@ class NoteViewTests(TestCase):
         response = self.client.post(url)
         self.assertRedirects(response, reverse("note_list"))
         self.assertEqual(Note.objects.count(), 0)
+
+    def test_note_delete_view_post_404_for_unknown_note(self):
+        """POSTing a delete for a non-existent note should return 404."""
+        url = reverse("note_delete", args=[9999])
+        response = self.client.post(url)
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(Note.objects.count(), 1)
+
+
+class NoteAdminTests(TestCase):
+    """Tests for the Note admin."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_superuser(
+            username="admin", email="admin@example.com", password="password"
+        )
+        cls.note = Note.objects.create(
+            title="Admin Note",
+            content="Admin note content.",
+        )
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def _note_queries(self, url):
+        """GET url and return the captured SQL that reads the notes table."""
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return [q["sql"] for q in context.captured_queries if "notes_note" in q["sql"]]
+
+    def test_changelist_does_not_load_content(self):
+        """The changelist should not select the content column."""
+        queries = self._note_queries(reverse("admin:notes_note_changelist"))
+        self.assertTrue(queries)
+        for sql in queries:
+            self.assertNotIn('"content"', sql)
+
+    def test_change_view_loads_note_in_one_query(self):
+        """The change form should fetch the note with a single SELECT."""
+        url = reverse("admin:notes_note_change", args=[self.note.pk])
+        queries = self._note_queries(url)
+        self.assertEqual(len(queries), 1)
+        self.assertIn('"content"', queries[0])
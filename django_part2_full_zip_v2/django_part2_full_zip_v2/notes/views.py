@@ -8,18 +8,62 @@ These views implement basic CRUD operations for notes:
 - delete note
 """
 
+from django.core.paginator import Paginator
+from django.db import transaction
+from django.db.models import Max
+from django.http import Http404
 from django.shortcuts import get_object_or_404, redirect, render
+from django.utils import timezone
+from django.views.decorators.gzip import gzip_page
+from django.views.decorators.http import condition
 
-from .forms import NoteForm
+from .forms import NoteForm, empty_note_form_html
 from .models import Note
+from .signals import bump_list_version, get_list_version
 
-
-def note_list(request):
-    """Display a list of all notes."""
-    notes = Note.objects.all().order_by("id")
-    return render(request, "notes/note_list.html", {"notes": notes})
+# Number of notes shown on each page of the list view.
+NOTES_PER_PAGE = 50
 
 
+@gzip_page
+def note_list(request):
+    """Display a paginated list of notes.
+
+    Only the columns rendered by the template are selected, so the
+    potentially large ``content`` field is never loaded here. The
+    rendered list is fragment-cached under the page number, the note
+    count, MAX(updated_at) and the list version from ``notes.signals``.
+    Deletions change the count, and every create or edit bumps the
+    version, so a write always misses the cache even if its timestamp
+    does not move MAX(updated_at).
+    """
+    notes = Note.objects.only("id", "title").order_by("id")
+    paginator = Paginator(notes, NOTES_PER_PAGE)
+    page_obj = paginator.get_page(request.GET.get("page"))
+    last_updated = Note.objects.aggregate(last=Max("updated_at"))["last"]
+    return render(
+        request,
+        "notes/note_list.html",
+        {
+            "page_obj": page_obj,
+            "notes": page_obj.object_list,
+            "last_updated": last_updated,
+            "list_version": get_list_version(),
+        },
+    )
+
+
+def _note_etag(request, pk):
+    """Return an ETag for the note's current version, or None if missing."""
+    updated_at = (
+        Note.objects.filter(pk=pk).values_list("updated_at", flat=True).first()
+    )
+    if updated_at is None:
+        return None
+    return f"{pk}-{updated_at.timestamp()}"
+
+
+@condition(etag_func=_note_etag)
 def note_detail(request, pk):
     """Display the details for a single note."""
     note = get_object_or_404(Note, pk=pk)
@@ -29,35 +73,49 @@ def note_detail(request, pk):
 def note_create(request):
     """Create a brand new note.
 
-    On GET: render an empty form.
+    On GET: render an empty form from its cached markup.
     On POST: validate and save, then redirect to the detail view.
     """
     if request.method == "POST":
         form = NoteForm(request.POST)
         if form.is_valid():
-            note = form.save()
+            with transaction.atomic():
+                note = form.save()
             return redirect("note_detail", pk=note.pk)
+        context = {"form": form}
     else:
-        form = NoteForm()
+        # No form instance is needed: the template only checks
+        # form.instance.pk, which is unset when creating a note.
+        context = {"form_html": empty_note_form_html()}
 
-    return render(request, "notes/note_form.html", {"form": form})
+    return render(request, "notes/note_form.html", context)
 
 
 def note_update(request, pk):
     """Update an existing note.
 
     On GET: render a form pre-populated with the note data.
-    On POST: validate and save changes, then redirect to the detail view.
+    On POST: validate and write the changes with a single UPDATE, then
+    redirect to the detail view.
     """
-    note = get_object_or_404(Note, pk=pk)
-
     if request.method == "POST":
-        form = NoteForm(request.POST, instance=note)
+        form = NoteForm(request.POST, instance=Note(pk=pk))
         if form.is_valid():
-            note = form.save()
-            return redirect("note_detail", pk=note.pk)
+            # QuerySet.update() bypasses auto_now, so set updated_at here.
+            with transaction.atomic():
+                updated = Note.objects.filter(pk=pk).update(
+                    updated_at=timezone.now(), **form.cleaned_data
+                )
+                # update() sends no post_save, so bump the list version here.
+                transaction.on_commit(bump_list_version)
+            if not updated:
+                raise Http404("No Note matches the given query.")
+            return redirect("note_detail", pk=pk)
+        # Only re-render the form for a note that actually exists.
+        if not Note.objects.filter(pk=pk).exists():
+            raise Http404("No Note matches the given query.")
     else:
-        form = NoteForm(instance=note)
+        form = NoteForm(instance=get_object_or_404(Note, pk=pk))
 
     return render(request, "notes/note_form.html", {"form": form})
 
@@ -66,12 +124,14 @@ def note_delete(request, pk):
     """Delete an existing note.
 
     On GET: show a confirmation page.
-    On POST: delete the note and redirect back to the list.
+    On POST: delete the note with a single DELETE and redirect back to
+    the list.
     """
-    note = get_object_or_404(Note, pk=pk)
-
     if request.method == "POST":
-        note.delete()
+        deleted, _ = Note.objects.filter(pk=pk).delete()
+        if not deleted:
+            raise Http404("No Note matches the given query.")
         return redirect("note_list")
 
+    note = get_object_or_404(Note, pk=pk)
     return render(request, "notes/note_confirm_delete.html", {"note": note})